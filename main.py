@@ -1,265 +1,617 @@
+from __future__ import annotations
+
 import argparse
+import io
 import math
+import os
+from functools import lru_cache
+from multiprocessing import Pool
 from textwrap import dedent
+from typing import Any, Callable
 
 import ezdxf
 import matplotlib.pyplot as plt
 import numpy as np
+from ezdxf.entities import DXFGraphic
+from matplotlib.artist import Artist
 from matplotlib.axes import Axes
 from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from matplotlib.patches import PathPatch
+from matplotlib.path import Path
+from pypdf import PdfWriter
 
+EntityCache = dict[str, "np.ndarray | list[np.ndarray]"]
 
-def draw_entities(
-    entities: ezdxf.layouts.Layout,
-    ax: Axes,
-    entities_to_draw: list[str],
-) -> None:
-    """Draw DXF entities on matplotlib axes"""
-    for e in entities:
-        if e.dxftype() not in entities_to_draw:
-            continue
+# Arcs and ellipses are drawn as cubic Béziers spanning at most this angle
+MAX_BEZIER_ANGLE = math.pi / 4
 
-        try:
-            if e.dxftype() == "LINE":
-                start, end = e.dxf.start, e.dxf.end
-                ax.plot(
-                    [start.x, end.x], [start.y, end.y], color="black", linewidth=0.5
-                )
+# Resolution of rasterized artists in the PDF (vector output is unaffected)
+RASTER_DPI = 300
 
-            if e.dxftype() == "CIRCLE":
-                center, radius = e.dxf.center, e.dxf.radius
-                circle = plt.Circle(
-                    (center.x, center.y),
-                    radius,
-                    fill=False,
-                    color="black",
-                    linewidth=0.5,
-                )
-                ax.add_patch(circle)
-                ax.plot(center.x, center.y, "o", color="black", markersize=2)
-
-            elif e.dxftype() == "ARC":
-                center, radius = e.dxf.center, e.dxf.radius
-                start_angle = math.radians(e.dxf.start_angle)
-                end_angle = math.radians(e.dxf.end_angle)
-
-                # Handle arcs that cross 0° (start_angle > end_angle)
-                if e.dxf.start_angle > e.dxf.end_angle:
-                    # Arc crosses 0°, need to go from start_angle to 2π, then from 0 to end_angle
-                    theta1 = np.linspace(start_angle, 2 * math.pi, 50)
-                    theta2 = np.linspace(0, end_angle, 50)
-                    theta = np.concatenate([theta1, theta2])
-                else:
-                    # Normal arc
-                    theta = np.linspace(start_angle, end_angle, 100)
-
-                x = center.x + radius * np.cos(theta)
-                y = center.y + radius * np.sin(theta)
-                ax.plot(x, y, color="black", linewidth=0.5)
-
-            elif e.dxftype() == "LWPOLYLINE":
-                points = e.get_points("xy")
-                if len(points) > 1:
-                    if e.closed:
-                        points = list(points) + [points[0]]  # Close the polyline
-                    x, y = zip(*points)
-                    ax.plot(x, y, color="black", linewidth=0.5)
-
-            elif e.dxftype() == "POLYLINE":
-                if not e.is_3d_polyline and not e.is_3d_mesh:
-                    points = [v.dxf.location for v in e.vertices]
-                    if len(points) > 1:
-                        if e.is_closed:
-                            points.append(points[0])  # Close the polyline
-                        x = [p.x for p in points]
-                        y = [p.y for p in points]
-                        ax.plot(x, y, color="black", linewidth=0.5)
-
-            elif e.dxftype() == "ELLIPSE":
-                # Basic ellipse support
-                center = e.dxf.center
-                major_axis = e.dxf.major_axis
-                ratio = e.dxf.ratio
-                start_param = e.dxf.start_param
-                end_param = e.dxf.end_param
-
-                # Create ellipse points
-                if end_param < start_param:
-                    end_param += 2 * math.pi
-                t = np.linspace(start_param, end_param, 100)
-
-                # Major and minor axis lengths
-                major_length = math.sqrt(major_axis.x**2 + major_axis.y**2)
-                minor_length = major_length * ratio
-
-                # Rotation angle
-                rotation = math.atan2(major_axis.y, major_axis.x)
-
-                # Parametric ellipse
-                x_local = major_length * np.cos(t)
-                y_local = minor_length * np.sin(t)
-
-                # Rotate and translate
-                cos_rot = math.cos(rotation)
-                sin_rot = math.sin(rotation)
-                x = center.x + x_local * cos_rot - y_local * sin_rot
-                y = center.y + x_local * sin_rot + y_local * cos_rot
-
-                ax.plot(x, y, color="black", linewidth=0.5)
-
-            elif e.dxftype() == "SPLINE":
-                # Basic spline support using control points
+
+def _line_row(e: DXFGraphic) -> tuple[float, ...]:
+    start, end = e.dxf.start, e.dxf.end
+    return (start.x, start.y, end.x, end.y)
+
+
+def _circle_row(e: DXFGraphic) -> tuple[float, ...]:
+    center = e.dxf.center
+    return (center.x, center.y, e.dxf.radius)
+
+
+def _arc_row(e: DXFGraphic) -> tuple[float, ...]:
+    center = e.dxf.center
+    return (center.x, center.y, e.dxf.radius, e.dxf.start_angle, e.dxf.end_angle)
+
+
+def _ellipse_row(e: DXFGraphic) -> tuple[float, ...]:
+    center, major_axis = e.dxf.center, e.dxf.major_axis
+    return (
+        center.x,
+        center.y,
+        major_axis.x,
+        major_axis.y,
+        e.dxf.ratio,
+        e.dxf.start_param,
+        e.dxf.end_param,
+    )
+
+
+def _point_row(e: DXFGraphic) -> tuple[float, ...]:
+    point = e.dxf.location
+    return (point.x, point.y)
+
+
+def _text_row(e: DXFGraphic) -> tuple[float, ...]:
+    # For text, use insertion point as approximate bounds
+    point = e.dxf.insert
+    return (point.x, point.y)
+
+
+def _lwpolyline_vertices(e: DXFGraphic) -> np.ndarray | None:
+    # Slice x, y straight out of the packed (x, y, start_width, end_width, bulge)
+    # vertex storage instead of building a list of tuples via get_points()
+    lwpoints = e.lwpoints
+    values = np.array(lwpoints.values, dtype=np.float64)
+    points = values.reshape(-1, lwpoints.VERTEX_SIZE)[:, :2]
+    if len(points) < 2:
+        return None
+    if e.closed:
+        points = np.vstack([points, points[:1]])
+    return points
+
+
+def _polyline_vertices(e: DXFGraphic) -> np.ndarray | None:
+    if e.is_3d_polyline or e.is_3d_mesh:
+        return None
+    locations = [v.dxf.location for v in e.vertices]
+    if len(locations) < 2:
+        return None
+    if e.is_closed:
+        locations.append(locations[0])
+    return np.array([(p.x, p.y) for p in locations], dtype=np.float64)
+
+
+def _spline_vertices(e: DXFGraphic) -> np.ndarray | None:
+    # Basic spline support using control points: one (k, 3) array straight
+    # from the control point storage, then keep the x, y columns
+    points = np.array(e.control_points, dtype=np.float64).reshape(-1, 3)
+    if len(points) > 1:
+        return points[:, :2]
+    return None
+
+
+# DXF type -> (per-entity extractor, row width or None for vertex-array lists)
+_EXTRACTORS: dict[str, tuple[Callable[[DXFGraphic], Any], int | None]] = {
+    "LINE": (_line_row, 4),
+    "CIRCLE": (_circle_row, 3),
+    "ARC": (_arc_row, 5),
+    "ELLIPSE": (_ellipse_row, 7),
+    "POINT": (_point_row, 2),
+    "TEXT": (_text_row, 2),
+    "LWPOLYLINE": (_lwpolyline_vertices, None),
+    "POLYLINE": (_polyline_vertices, None),
+    "SPLINE": (_spline_vertices, None),
+}
+
+
+def partition_entities(msp: ezdxf.layouts.Layout) -> dict[str, list[DXFGraphic]]:
+    """Group modelspace entities by DXF type in a single pass"""
+    by_type: dict[str, list[DXFGraphic]] = {dxftype: [] for dxftype in _EXTRACTORS}
+    for e in msp:
+        group = by_type.get(e.dxftype())
+        if group is not None:
+            group.append(e)
+    return by_type
+
+
+def preprocess_entities(msp: ezdxf.layouts.Layout) -> EntityCache:
+    """Extract entity geometry into plain NumPy arrays, keyed by DXF type
+
+    Array layouts:
+        LINE:       (N, 4) start_x, start_y, end_x, end_y
+        CIRCLE:     (N, 3) center_x, center_y, radius
+        ARC:        (N, 5) center_x, center_y, radius, start_angle, end_angle (degrees)
+        ELLIPSE:    (N, 7) center_x, center_y, major_x, major_y, ratio, start_param, end_param
+        POINT:      (N, 2) x, y
+        TEXT:       (N, 2) insertion x, y (only used for bounds)
+        LWPOLYLINE, POLYLINE, SPLINE: list of (k, 2) vertex arrays, closed ones
+            already have their first vertex repeated at the end
+    """
+    cache: EntityCache = {}
+    dropped: dict[str, list[Exception]] = {}
+    for dxftype, entities in partition_entities(msp).items():
+        extract, width = _EXTRACTORS[dxftype]
+        try:
+            # Fast path: the whole type in one go, no handler per entity
+            rows = [extract(e) for e in entities]
+        except Exception:
+            # Redo this type entity by entity and drop the ones that fail
+            rows = []
+            for e in entities:
                 try:
-                    if hasattr(e, "control_points"):
-                        points = [(cp.x, cp.y) for cp in e.control_points]
-                        if len(points) > 1:
-                            x, y = zip(*points)
-                            ax.plot(x, y, color="black", linewidth=0.5, linestyle="--")
-                except:
-                    pass  # Skip complex splines
+                    rows.append(extract(e))
+                except Exception as ex:
+                    dropped.setdefault(dxftype, []).append(ex)
+        rows = [row for row in rows if row is not None]
+
+        if width is None:
+            cache[dxftype] = rows
+        else:
+            cache[dxftype] = np.array(rows, dtype=np.float64).reshape(-1, width)
+
+    for dxftype, errors in dropped.items():
+        print(f"Warning: Skipped {len(errors)} {dxftype} entities: {errors[0]}")
+
+    return cache
+
+
+def line_segments(lines: np.ndarray) -> list[np.ndarray]:
+    """Convert (N, 4) LINE rows into (2, 2) segments"""
+    return list(lines.reshape(-1, 2, 2))
+
+
+@lru_cache(maxsize=None)
+def _bezier_template(n_pieces: int) -> tuple[np.ndarray, np.ndarray]:
+    """Unit knot parameters and path codes shared by every curve split into n pieces"""
+    knots = np.linspace(0.0, 1.0, n_pieces + 1)
+    codes = np.full(3 * n_pieces + 1, Path.CURVE4, dtype=Path.code_type)
+    codes[0] = Path.MOVETO
+    return knots, codes
+
+
+def bezier_curves(
+    center: np.ndarray,
+    axis_u: np.ndarray,
+    axis_v: np.ndarray,
+    start: np.ndarray,
+    span: np.ndarray,
+) -> Path:
+    """Approximate elliptical arcs C + cos(t) * U + sin(t) * V with cubic Béziers
+
+    Each curve is split into equal pieces of at most MAX_BEZIER_ANGLE. The
+    control points are computed on the unit circle and mapped through the
+    conjugate diameters U, V, which is exact because an ellipse is an affine
+    image of a circle. All curves are returned as one compound path.
+    """
+    n_pieces = np.ceil(np.abs(span) / MAX_BEZIER_ANGLE).clip(min=1).astype(int)
+    # (N, 2, 2) matrices with columns U, V map the unit circle onto each ellipse
+    basis = np.stack([axis_u, axis_v], axis=-1)
+
+    vertices: list[np.ndarray] = []
+    codes: list[np.ndarray] = []
+    for n in np.unique(n_pieces):
+        idx = np.flatnonzero(n_pieces == n)
+        unit_knots, curve_codes = _bezier_template(int(n))
+        knots = start[idx, None] + span[idx, None] * unit_knots
+        cos_k, sin_k = np.cos(knots), np.sin(knots)
+        points = np.stack([cos_k, sin_k], axis=-1)
+        tangents = np.stack([-sin_k, cos_k], axis=-1)
+
+        # Tangent handle length for a piece spanning angle a: 4/3 * tan(a / 4)
+        tau = (4 / 3 * np.tan(span[idx] / (4 * n)))[:, None, None]
+        ctrl1 = points[:, :-1] + tau * tangents[:, :-1]
+        ctrl2 = points[:, 1:] - tau * tangents[:, 1:]
+        pieces = np.stack([ctrl1, ctrl2, points[:, 1:]], axis=2).reshape(
+            len(idx), -1, 2
+        )
+        local = np.concatenate([points[:, :1], pieces], axis=1)
+
+        # Laid out as [p0, c1, c2, p1, c1, c2, p2, ...] per curve
+        xy = np.einsum("eij,ekj->eki", basis[idx], local) + center[idx, None, :]
+        vertices.append(xy.reshape(-1, 2))
+        codes.append(np.tile(curve_codes, len(idx)))
+
+    if not vertices:
+        return Path(np.empty((0, 2)))
+    return Path(np.concatenate(vertices), np.concatenate(codes))
+
+
+def arc_curves(arcs: np.ndarray) -> Path:
+    """Convert (N, 5) ARC rows into a compound Bézier path"""
+    cx, cy, radius, start_deg, end_deg = arcs.T
+    start_angle = np.radians(start_deg)
+    end_angle = np.radians(end_deg)
+
+    # Arcs that cross 0° (start_angle > end_angle) continue past 2π
+    end_angle = np.where(start_deg > end_deg, end_angle + 2 * math.pi, end_angle)
+
+    zeros = np.zeros_like(radius)
+    return bezier_curves(
+        center=np.stack([cx, cy], axis=-1),
+        axis_u=np.stack([radius, zeros], axis=-1),
+        axis_v=np.stack([zeros, radius], axis=-1),
+        start=start_angle,
+        span=end_angle - start_angle,
+    )
 
-            elif e.dxftype() == "POINT":
-                point = e.dxf.location
-                ax.plot(point.x, point.y, "o", color="black", markersize=1)
 
-            # Add more entity types as needed
-            else:
-                # For unsupported entities, try to get basic geometry
-                pass
+def circle_curves(circles: np.ndarray) -> Path:
+    """Convert (N, 3) CIRCLE rows into a compound Bézier path"""
+    cx, cy, radius = circles.T
+    zeros = np.zeros_like(radius)
+    return bezier_curves(
+        center=np.stack([cx, cy], axis=-1),
+        axis_u=np.stack([radius, zeros], axis=-1),
+        axis_v=np.stack([zeros, radius], axis=-1),
+        start=zeros,
+        span=np.full_like(radius, 2 * math.pi),
+    )
 
-        except Exception as ex:
-            print(f"Error drawing {e.dxftype()}: {ex}")
-            continue
+
+def ellipse_curves(ellipses: np.ndarray) -> Path:
+    """Convert (N, 7) ELLIPSE rows into a compound Bézier path"""
+    cx, cy, major_x, major_y, ratio, start_param, end_param = ellipses.T
+    end_param = np.where(end_param < start_param, end_param + 2 * math.pi, end_param)
+
+    # Minor axis is the major axis rotated by 90° and scaled by the ratio
+    return bezier_curves(
+        center=np.stack([cx, cy], axis=-1),
+        axis_u=np.stack([major_x, major_y], axis=-1),
+        axis_v=np.stack([-major_y * ratio, major_x * ratio], axis=-1),
+        start=start_param,
+        span=end_param - start_param,
+    )
+
+
+def draw_points(points: np.ndarray, ax: Axes, markersize: float = 1) -> list[Artist]:
+    """Draw (N, 2) point rows as small dots"""
+    if not len(points):
+        return []
+    return ax.plot(
+        points[:, 0], points[:, 1], "o", color="black", markersize=markersize
+    )
+
+
+def draw_cached(
+    cache: EntityCache,
+    ax: Axes,
+    entities_to_draw: list[str],
+    rasterize_threshold: int | None = None,
+) -> list[Artist]:
+    """Draw preprocessed DXF geometry on matplotlib axes, returning the new artists
+
+    When the outline collection holds more than rasterize_threshold
+    segments it is rasterized at RASTER_DPI instead of written as vectors.
+    """
+    artists: list[Artist] = []
+
+    # All black outlines are batched into a single LineCollection
+    segments: list[np.ndarray] = []
+    if "LINE" in entities_to_draw:
+        segments += line_segments(cache["LINE"])
+    if "LWPOLYLINE" in entities_to_draw:
+        segments += cache["LWPOLYLINE"]
+    if "POLYLINE" in entities_to_draw:
+        segments += cache["POLYLINE"]
+
+    if segments:
+        collection = LineCollection(
+            segments, colors="black", linewidths=0.5, capstyle="butt"
+        )
+        if rasterize_threshold is not None:
+            collection.set_rasterized(len(segments) > rasterize_threshold)
+        artists.append(ax.add_collection(collection, autolim=False))
+
+    # Circles, arcs and ellipses are merged into one compound Bézier path
+    curves: list[Path] = []
+    if "CIRCLE" in entities_to_draw:
+        curves.append(circle_curves(cache["CIRCLE"]))
+    if "ARC" in entities_to_draw:
+        curves.append(arc_curves(cache["ARC"]))
+    if "ELLIPSE" in entities_to_draw:
+        curves.append(ellipse_curves(cache["ELLIPSE"]))
+
+    path = Path.make_compound_path(*curves) if curves else Path(np.empty((0, 2)))
+    if len(path.vertices):
+        patch = PathPatch(path, fill=False, edgecolor="black", linewidth=0.5)
+        artists.append(ax.add_patch(patch))
+
+    if "SPLINE" in entities_to_draw and cache["SPLINE"]:
+        collection = LineCollection(
+            cache["SPLINE"],
+            colors="black",
+            linewidths=0.5,
+            linestyles="--",
+            capstyle="butt",
+        )
+        artists.append(ax.add_collection(collection, autolim=False))
+
+    if "CIRCLE" in entities_to_draw:
+        artists += draw_points(cache["CIRCLE"][:, 0:2], ax, markersize=2)
+    if "POINT" in entities_to_draw:
+        artists += draw_points(cache["POINT"], ax)
+
+    return artists
 
 
 def add_crop_marks(
     ax: Axes, xlim: tuple[float, float], ylim: tuple[float, float], mark_len: float = 5
-) -> None:
+) -> LineCollection:
     """Draw crop marks at the corners of the printable region"""
     x0, x1 = xlim
     y0, y1 = ylim
-    # Bottom-left
-    ax.plot([x0, x0 + mark_len], [y0, y0], color="gray", linewidth=0.5)
-    ax.plot([x0, x0], [y0, y0 + mark_len], color="gray", linewidth=0.5)
-    # Bottom-right
-    ax.plot([x1 - mark_len, x1], [y0, y0], color="gray", linewidth=0.5)
-    ax.plot([x1, x1], [y0, y0 + mark_len], color="gray", linewidth=0.5)
-    # Top-left
-    ax.plot([x0, x0 + mark_len], [y1, y1], color="gray", linewidth=0.5)
-    ax.plot([x0, x0], [y1 - mark_len, y1], color="gray", linewidth=0.5)
-    # Top-right
-    ax.plot([x1 - mark_len, x1], [y1, y1], color="gray", linewidth=0.5)
-    ax.plot([x1, x1], [y1 - mark_len, y1], color="gray", linewidth=0.5)
+    marks = [
+        # Bottom-left
+        [(x0, y0), (x0 + mark_len, y0)],
+        [(x0, y0), (x0, y0 + mark_len)],
+        # Bottom-right
+        [(x1 - mark_len, y0), (x1, y0)],
+        [(x1, y0), (x1, y0 + mark_len)],
+        # Top-left
+        [(x0, y1), (x0 + mark_len, y1)],
+        [(x0, y1 - mark_len), (x0, y1)],
+        # Top-right
+        [(x1 - mark_len, y1), (x1, y1)],
+        [(x1, y1 - mark_len), (x1, y1)],
+    ]
+    return ax.add_collection(
+        LineCollection(marks, colors="gray", linewidths=0.5, capstyle="butt"),
+        autolim=False,
+    )
+
+
+def _angle_in_arc(
+    angle: float, start_deg: np.ndarray, end_deg: np.ndarray
+) -> np.ndarray:
+    """Whether angle (degrees) lies on each arc running counter-clockwise"""
+    return np.where(
+        start_deg <= end_deg,
+        (start_deg <= angle) & (angle <= end_deg),
+        # Arc crosses 0°
+        (angle >= start_deg) | (angle <= end_deg),
+    )
+
+
+def line_bounds(lines: np.ndarray) -> np.ndarray:
+    """(N, 4) min_x, min_y, max_x, max_y of LINE rows"""
+    return np.concatenate(
+        [
+            np.minimum(lines[:, 0:2], lines[:, 2:4]),
+            np.maximum(lines[:, 0:2], lines[:, 2:4]),
+        ],
+        axis=1,
+    )
+
+
+def circle_bounds(circles: np.ndarray) -> np.ndarray:
+    """(N, 4) min_x, min_y, max_x, max_y of CIRCLE rows"""
+    center, radius = circles[:, 0:2], circles[:, 2:3]
+    return np.concatenate([center - radius, center + radius], axis=1)
+
+
+def arc_bounds(arcs: np.ndarray) -> np.ndarray:
+    """(N, 4) min_x, min_y, max_x, max_y of ARC rows"""
+    cx, cy, radius, start_deg, end_deg = arcs.T
+    start_angle = np.radians(start_deg)
+    end_angle = np.radians(end_deg)
+
+    # Start with arc endpoints
+    start_x = cx + radius * np.cos(start_angle)
+    start_y = cy + radius * np.sin(start_angle)
+    end_x = cx + radius * np.cos(end_angle)
+    end_y = cy + radius * np.sin(end_angle)
+    min_x = np.minimum(start_x, end_x)
+    min_y = np.minimum(start_y, end_y)
+    max_x = np.maximum(start_x, end_x)
+    max_y = np.maximum(start_y, end_y)
+
+    # Check for extremes: 0° (max x), 90° (max y), 180° (min x), 270° (min y)
+    max_x = np.where(_angle_in_arc(0, start_deg, end_deg), cx + radius, max_x)
+    max_y = np.where(_angle_in_arc(90, start_deg, end_deg), cy + radius, max_y)
+    min_x = np.where(_angle_in_arc(180, start_deg, end_deg), cx - radius, min_x)
+    min_y = np.where(_angle_in_arc(270, start_deg, end_deg), cy - radius, min_y)
+    return np.stack([min_x, min_y, max_x, max_y], axis=-1)
+
+
+def ellipse_bounds(ellipses: np.ndarray) -> np.ndarray:
+    """(N, 4) min_x, min_y, max_x, max_y of ELLIPSE rows
+
+    With conjugate diameters U, V the curve is C + cos(t) * U + sin(t) * V,
+    so x(t) is extreme at t = atan2(Vx, Ux) (+ π) and y(t) at atan2(Vy, Uy)
+    (+ π). Only the extremes that fall inside the parameter range count,
+    together with the two end points.
+    """
+    cx, cy, major_x, major_y, ratio, start_param, end_param = ellipses.T
+    end_param = np.where(end_param < start_param, end_param + 2 * math.pi, end_param)
+    minor_x, minor_y = -major_y * ratio, major_x * ratio
+
+    tx = np.arctan2(minor_x, major_x)
+    ty = np.arctan2(minor_y, major_y)
+    t = np.stack([start_param, end_param, tx, tx + math.pi, ty, ty + math.pi], axis=-1)
+
+    # Replace out-of-range extremes with the start point, which is always on the curve
+    in_range = (
+        np.mod(t - start_param[:, None], 2 * math.pi)
+        <= (end_param - start_param)[:, None]
+    )
+    t = np.where(in_range, t, start_param[:, None])
+
+    cos_t, sin_t = np.cos(t), np.sin(t)
+    x = cx[:, None] + cos_t * major_x[:, None] + sin_t * minor_x[:, None]
+    y = cy[:, None] + cos_t * major_y[:, None] + sin_t * minor_y[:, None]
+    return np.stack(
+        [x.min(axis=1), y.min(axis=1), x.max(axis=1), y.max(axis=1)], axis=-1
+    )
+
+
+def point_bounds(points: np.ndarray) -> np.ndarray:
+    """(N, 4) degenerate boxes of (N, 2) point rows"""
+    return np.concatenate([points, points], axis=1)
+
+
+def vertex_bounds(polylines: list[np.ndarray]) -> np.ndarray:
+    """(N, 4) min_x, min_y, max_x, max_y of each vertex array"""
+    boxes = [np.concatenate([pts.min(axis=0), pts.max(axis=0)]) for pts in polylines]
+    return np.array(boxes, dtype=np.float64).reshape(-1, 4)
+
+
+# DXF type -> per-entity (N, 4) bounds of its cached geometry
+_BOUNDS: dict[str, Callable[[Any], np.ndarray]] = {
+    "LINE": line_bounds,
+    "CIRCLE": circle_bounds,
+    "ARC": arc_bounds,
+    "ELLIPSE": ellipse_bounds,
+    "POINT": point_bounds,
+    "TEXT": point_bounds,
+    "LWPOLYLINE": vertex_bounds,
+    "POLYLINE": vertex_bounds,
+    "SPLINE": vertex_bounds,
+}
+
+
+def entity_bounds(cache: EntityCache) -> dict[str, np.ndarray]:
+    """(N, 4) min_x, min_y, max_x, max_y of every cached entity, keyed by DXF type"""
+    return {dxftype: bounds(cache[dxftype]) for dxftype, bounds in _BOUNDS.items()}
+
+
+def cull_entities(
+    cache: EntityCache,
+    bounds: dict[str, np.ndarray],
+    tile: tuple[float, float, float, float],
+) -> EntityCache:
+    """Subset of the cache whose entities overlap the (x0, x1, y0, y1) tile"""
+    x0, x1, y0, y1 = tile
+    culled: EntityCache = {}
+    for dxftype, boxes in bounds.items():
+        hits = (
+            (boxes[:, 0] <= x1)
+            & (boxes[:, 2] >= x0)
+            & (boxes[:, 1] <= y1)
+            & (boxes[:, 3] >= y0)
+        )
+        entities = cache[dxftype]
+        if isinstance(entities, list):
+            culled[dxftype] = [entities[i] for i in np.flatnonzero(hits)]
+        else:
+            culled[dxftype] = entities[hits]
+    return culled
 
 
 def calculate_bounding_box(
-    msp: ezdxf.layouts.Layout,
+    bounds: dict[str, np.ndarray],
 ) -> tuple[float, float, float, float]:
-    """Calculate bounding box manually for older ezdxf versions"""
-    min_x = float("inf")
-    min_y = float("inf")
-    max_x = float("-inf")
-    max_y = float("-inf")
-
-    for entity in msp:
-        try:
-            if entity.dxftype() == "LINE":
-                start, end = entity.dxf.start, entity.dxf.end
-                min_x = min(min_x, start.x, end.x)
-                min_y = min(min_y, start.y, end.y)
-                max_x = max(max_x, start.x, end.x)
-                max_y = max(max_y, start.y, end.y)
-
-            elif entity.dxftype() == "CIRCLE":
-                center, radius = entity.dxf.center, entity.dxf.radius
-                min_x = min(min_x, center.x - radius)
-                min_y = min(min_y, center.y - radius)
-                max_x = max(max_x, center.x + radius)
-                max_y = max(max_y, center.y + radius)
-
-            elif entity.dxftype() == "ARC":
-                center, radius = entity.dxf.center, entity.dxf.radius
-                # More accurate arc bounds calculation
-                start_angle = math.radians(entity.dxf.start_angle)
-                end_angle = math.radians(entity.dxf.end_angle)
-
-                # Calculate actual arc endpoints
-                start_x = center.x + radius * math.cos(start_angle)
-                start_y = center.y + radius * math.sin(start_angle)
-                end_x = center.x + radius * math.cos(end_angle)
-                end_y = center.y + radius * math.sin(end_angle)
-
-                # Start with arc endpoints
-                arc_min_x = min(start_x, end_x)
-                arc_max_x = max(start_x, end_x)
-                arc_min_y = min(start_y, end_y)
-                arc_max_y = max(start_y, end_y)
-
-                # Check if arc includes extreme points (0°, 90°, 180°, 270°)
-                def angle_in_arc(
-                    angle: float, start_deg: float, end_deg: float
-                ) -> bool:
-                    if start_deg <= end_deg:
-                        return start_deg <= angle <= end_deg
-                    else:  # Arc crosses 0°
-                        return angle >= start_deg or angle <= end_deg
-
-                # Check for extremes: 0° (max x), 90° (max y), 180° (min x), 270° (min y)
-                if angle_in_arc(0, entity.dxf.start_angle, entity.dxf.end_angle):
-                    arc_max_x = center.x + radius
-                if angle_in_arc(90, entity.dxf.start_angle, entity.dxf.end_angle):
-                    arc_max_y = center.y + radius
-                if angle_in_arc(180, entity.dxf.start_angle, entity.dxf.end_angle):
-                    arc_min_x = center.x - radius
-                if angle_in_arc(270, entity.dxf.start_angle, entity.dxf.end_angle):
-                    arc_min_y = center.y - radius
-
-                min_x = min(min_x, arc_min_x)
-                min_y = min(min_y, arc_min_y)
-                max_x = max(max_x, arc_max_x)
-                max_y = max(max_y, arc_max_y)
-
-            elif entity.dxftype() == "LWPOLYLINE":
-                points = entity.get_points("xy")
-                for point in points:
-                    min_x = min(min_x, point[0])
-                    min_y = min(min_y, point[1])
-                    max_x = max(max_x, point[0])
-                    max_y = max(max_y, point[1])
-
-            elif entity.dxftype() == "POLYLINE":
-                if not entity.is_3d_polyline and not entity.is_3d_mesh:
-                    points = [v.dxf.location for v in entity.vertices]
-                    for point in points:
-                        min_x = min(min_x, point.x)
-                        min_y = min(min_y, point.y)
-                        max_x = max(max_x, point.x)
-                        max_y = max(max_y, point.y)
-
-            elif entity.dxftype() == "POINT":
-                point = entity.dxf.location
-                min_x = min(min_x, point.x)
-                min_y = min(min_y, point.y)
-                max_x = max(max_x, point.x)
-                max_y = max(max_y, point.y)
-
-            elif entity.dxftype() == "TEXT":
-                # For text, use insertion point as approximate bounds
-                point = entity.dxf.insert
-                min_x = min(min_x, point.x)
-                min_y = min(min_y, point.y)
-                max_x = max(max_x, point.x)
-                max_y = max(max_y, point.y)
-
-        except Exception as ex:
-            print(f"Warning: Error calculating bounds for {entity.dxftype()}: {ex}")
-            continue
+    """Calculate the drawing bounding box from per-entity bounds"""
+    boxes = np.concatenate(list(bounds.values()))
 
     # Handle case where no entities were found
-    if min_x == float("inf"):
+    if not boxes.size:
         return 0, 0, 0, 0
 
-    return min_x, min_y, max_x, max_y
+    min_x, min_y = boxes[:, 0:2].min(axis=0)
+    max_x, max_y = boxes[:, 2:4].max(axis=0)
+    return float(min_x), float(min_y), float(max_x), float(max_y)
+
+
+def setup_figure(
+    paper_size_mm: tuple[float, float], margin_mm: float
+) -> tuple[Figure, Axes]:
+    """Create a page-sized figure whose axes cover the printable region"""
+    content_w = paper_size_mm[0] - 2 * margin_mm
+    content_h = paper_size_mm[1] - 2 * margin_mm
+
+    fig = plt.figure(figsize=(paper_size_mm[0] / 25.4, paper_size_mm[1] / 25.4))
+    ax = fig.add_axes(
+        [
+            margin_mm / paper_size_mm[0],
+            margin_mm / paper_size_mm[1],
+            content_w / paper_size_mm[0],
+            content_h / paper_size_mm[1],
+        ]
+    )
+    ax.set_aspect("equal")
+    ax.axis("off")
+    return fig, ax
+
+
+def show_tile(
+    ax: Axes,
+    tile: tuple[float, float, float, float],
+    cache: EntityCache,
+    bounds: dict[str, np.ndarray],
+    entities_to_draw: list[str],
+    add_marks: bool,
+    rasterize_threshold: int | None,
+) -> list[Artist]:
+    """Point the axes at one (x0, x1, y0, y1) tile and draw what overlaps it
+
+    Only entities whose bounds intersect the tile are drawn; the axes clip
+    the rest of their geometry. Returns the artists to remove afterwards.
+    """
+    x0, x1, y0, y1 = tile
+    ax.set_xlim(x0, x1)
+    ax.set_ylim(y0, y1)
+
+    visible = cull_entities(cache, bounds, tile)
+    artists = draw_cached(
+        cache=visible,
+        ax=ax,
+        entities_to_draw=entities_to_draw,
+        rasterize_threshold=rasterize_threshold,
+    )
+    if add_marks:
+        artists.append(add_crop_marks(ax, (x0, x1), (y0, y1)))
+    return artists
+
+
+# Per-process axes plus the show_tile() arguments, set by _init_tile_worker()
+_worker_state: tuple | None = None
+
+
+def _init_tile_worker(
+    cache: EntityCache,
+    bounds: dict[str, np.ndarray],
+    entities_to_draw: list[str],
+    paper_size_mm: tuple[float, float],
+    margin_mm: float,
+    add_marks: bool,
+    rasterize_threshold: int | None,
+) -> None:
+    global _worker_state
+    _, ax = setup_figure(paper_size_mm, margin_mm)
+    _worker_state = (
+        ax,
+        cache,
+        bounds,
+        entities_to_draw,
+        add_marks,
+        rasterize_threshold,
+    )
+
+
+def render_tile(tile: tuple[float, float, float, float]) -> bytes:
+    """Render one tile as a single-page PDF in a worker process"""
+    assert _worker_state is not None, "tile worker was not initialized"
+    ax, *tile_args = _worker_state
+
+    artists = show_tile(ax, tile, *tile_args)
+    buffer = io.BytesIO()
+    ax.figure.savefig(buffer, format="pdf", dpi=RASTER_DPI)
+    for artist in artists:
+        artist.remove()
+    return buffer.getvalue()
 
 
 def dxf_to_pdf_tiled(
@@ -269,12 +621,19 @@ def dxf_to_pdf_tiled(
     paper_size_mm: tuple[float, float] = (210, 297),
     margin_mm: float = 10,
     add_marks: bool = True,
+    jobs: int = 1,
+    rasterize_threshold: int | None = 50_000,
 ) -> None:
     doc = ezdxf.readfile(dxf_path)
     msp = doc.modelspace()
 
-    # Use manual bounding box calculation instead of msp.bbox()
-    min_x, min_y, max_x, max_y = calculate_bounding_box(msp)
+    # Extract geometry once; bounds and every tile are computed from the cache
+    cache = preprocess_entities(msp)
+
+    # Per-entity bounds come from the cache rather than ezdxf.bbox: they are
+    # needed for tile culling anyway and are much cheaper than msp traversal
+    bounds = entity_bounds(cache)
+    min_x, min_y, max_x, max_y = calculate_bounding_box(bounds)
     width = max_x - min_x
     height = max_y - min_y
 
@@ -298,36 +657,56 @@ def dxf_to_pdf_tiled(
     print(f"🔲 Tiles: {cols} x {rows} (total: {cols * rows})")
     print(f"📏 Drawing bounds: {width:.2f} x {height:.2f}")
 
-    with PdfPages(pdf_path) as pdf:
-        for row in range(rows):
-            for col in range(cols):
-                x0 = min_x + col * content_w
-                x1 = min(x0 + content_w, max_x)
-                y0 = min_y + row * content_h
-                y1 = min(y0 + content_h, max_y)
-
-                fig = plt.figure(
-                    figsize=(paper_size_mm[0] / 25.4, paper_size_mm[1] / 25.4)
-                )
-                ax = fig.add_axes(
-                    [
-                        margin_mm / paper_size_mm[0],
-                        margin_mm / paper_size_mm[1],
-                        content_w / paper_size_mm[0],
-                        content_h / paper_size_mm[1],
-                    ]
+    tiles = []
+    for row in range(rows):
+        for col in range(cols):
+            x0 = min_x + col * content_w
+            x1 = min(x0 + content_w, max_x)
+            y0 = min_y + row * content_h
+            y1 = min(y0 + content_h, max_y)
+            tiles.append((x0, x1, y0, y1))
+
+    # Worker start-up (imports plus a copy of the cache) outweighs the render
+    # time of typical drawings, so tiles are only rendered in parallel on request
+    jobs = min(jobs or os.cpu_count() or 1, len(tiles))
+    if jobs <= 1:
+        fig, ax = setup_figure(paper_size_mm, margin_mm)
+        with PdfPages(pdf_path) as pdf:
+            for tile in tiles:
+                artists = show_tile(
+                    ax,
+                    tile,
+                    cache,
+                    bounds,
+                    entities_to_draw,
+                    add_marks,
+                    rasterize_threshold,
                 )
-                ax.set_xlim(x0, x1)
-                ax.set_ylim(y0, y1)
-                ax.set_aspect("equal")
-                ax.axis("off")
-
-                draw_entities(entities=msp, ax=ax, entities_to_draw=entities_to_draw)
-                if add_marks:
-                    add_crop_marks(ax, (x0, x1), (y0, y1))
-
-                pdf.savefig(fig)
-                plt.close(fig)
+                pdf.savefig(fig, dpi=RASTER_DPI)
+                for artist in artists:
+                    artist.remove()
+        plt.close(fig)
+    else:
+        # Every worker builds its own figure once, then renders one page per tile
+        with Pool(
+            jobs,
+            initializer=_init_tile_worker,
+            initargs=(
+                cache,
+                bounds,
+                entities_to_draw,
+                paper_size_mm,
+                margin_mm,
+                add_marks,
+                rasterize_threshold,
+            ),
+        ) as pool:
+            pages = pool.map(render_tile, tiles)
+
+        writer = PdfWriter()
+        for page in pages:
+            writer.append(io.BytesIO(page))
+        writer.write(pdf_path)
 
     print(f"✅ Saved multi-page PDF with tiling to: {pdf_path}")
 
@@ -406,6 +785,21 @@ def main() -> int:
         "--no-crop-marks", action="store_true", help="Disable crop marks on the output"
     )
 
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of processes used to render tiles, 0 for one per CPU (default: 1)",
+    )
+
+    parser.add_argument(
+        "--rasterize-threshold",
+        type=int,
+        default=50_000,
+        help="Rasterize a page's outlines when it has more segments than this (default: 50000)",
+    )
+
     parser.add_argument(
         "--entities-to-draw",
         nargs="+",
@@ -438,6 +832,8 @@ def main() -> int:
             paper_size_mm=paper_size,
             margin_mm=args.margin,
             add_marks=add_marks,
+            jobs=args.jobs,
+            rasterize_threshold=args.rasterize_threshold,
         )
 
     except FileNotFoundError as e: